@@ -0,0 +1,47 @@
+import pytest
+from factory.random import reseed_random
+
+from tests.utilities.time_converter import FilterByDate
+from tests.widgets.factories.widgets import reset_generators
+
+try:
+    from django.core.files.storage import InMemoryStorage
+except ImportError:  # Django < 4.2
+    InMemoryStorage = None
+
+
+@pytest.fixture
+def dates():
+    """Dates used by created_at filters, computed when the test runs rather than at import."""
+
+    return FilterByDate()
+
+
+@pytest.fixture(autouse=True)
+def in_memory_storage(settings):
+    """Keep image files produced by the image factories in memory instead of MEDIA_ROOT.
+
+    Needs Django 4.2+ (STORAGES and InMemoryStorage), on older versions files go to the
+    configured storage as before. InMemoryStorage has no .path, code reading FieldFile.path
+    fails with NotImplementedError under this fixture.
+    """
+
+    if InMemoryStorage is None:
+        return
+
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "default": {"BACKEND": "django.core.files.storage.InMemoryStorage"},
+    }
+
+
+@pytest.fixture(autouse=True)
+def reseed_factories(request):
+    """Seed factory_boy and Faker from the test id and restart the widget factories' counters.
+
+    Generated values then depend only on the test itself, not on the order
+    tests run in or on the pytest-xdist worker they land on.
+    """
+
+    reseed_random(request.node.nodeid)
+    reset_generators()
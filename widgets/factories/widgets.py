@@ -1,50 +1,89 @@
+import itertools
 import uuid
+from functools import lru_cache
 
 import factory
-from factory import DictFactory, Faker, SubFactory
+import faker
+from factory import DictFactory, SubFactory
 from factory.django import DjangoModelFactory
 
 from apps.widgets.models import Banner, Widget, WidgetApp
 from tests.core.factories.images import AppImageObjectFactory, BannerImageObjectFactory
 from tests.roles.factories.partners import PartnerFactory
 
+NAMES_POOL_SIZE = 1000
+
+link_ids = itertools.count(1)
+name_ids = itertools.count()
+
+
+@lru_cache(maxsize=None)
+def names_pool():
+    """ru_RU names generated once per session, Faker is slow to call per object."""
+
+    fake = faker.Faker("ru_RU")
+    fake.seed_instance(0)
+    names = {}
+    # Deduplicate so consecutive picks from the pool are always distinct
+    while len(names) < NAMES_POOL_SIZE:
+        names[fake.name()] = None
+    return tuple(names)
+
+
+def pooled_name():
+    """Walk the pool from the offset drawn in reset_generators().
+
+    Names don't repeat within a test unless it builds more than NAMES_POOL_SIZE objects.
+    """
+
+    return names_pool()[next(name_ids) % NAMES_POOL_SIZE]
+
+
+def generate_link():
+    """Unique link, reproducible as long as reset_generators() runs before each test.
+
+    The counter is shared so model and dict factories never produce the same link.
+    """
+
+    return f"https://{uuid.UUID(int=next(link_ids))}.com"
+
 
 class BannerFactory(DjangoModelFactory):
-    name = Faker("name")
+    name = factory.LazyFunction(pooled_name)
     partner = SubFactory(PartnerFactory)
     image = SubFactory(BannerImageObjectFactory)
-    link = f"https://{uuid.uuid4()}.com"
+    link = factory.LazyFunction(generate_link)
 
     class Meta:
         model = Banner
 
 
 class BannerDictFactory(DictFactory):
-    name = Faker("name")
+    name = factory.LazyFunction(pooled_name)
     partner = SubFactory(PartnerFactory)
     image = SubFactory(BannerImageObjectFactory)
-    link = f"https://{uuid.uuid4()}.com"
+    link = factory.LazyFunction(generate_link)
 
 
 class WidgetAppFactory(DjangoModelFactory):
-    name = Faker("name")
+    name = factory.LazyFunction(pooled_name)
     partner = SubFactory(PartnerFactory)
     image = SubFactory(AppImageObjectFactory)
-    link = f"https://{uuid.uuid4()}.com"
+    link = factory.LazyFunction(generate_link)
 
     class Meta:
         model = WidgetApp
 
 
 class WidgetAppDictFactory(DictFactory):
-    name = Faker("name")
+    name = factory.LazyFunction(pooled_name)
     partner = SubFactory(PartnerFactory)
     image = SubFactory(AppImageObjectFactory)
-    link = f"https://{uuid.uuid4()}.com"
+    link = factory.LazyFunction(generate_link)
 
 
 class WidgetFactory(DjangoModelFactory):
-    name = Faker("name")
+    name = factory.LazyFunction(pooled_name)
     partner = SubFactory(PartnerFactory)
     logo = SubFactory(AppImageObjectFactory)
 
@@ -71,8 +110,19 @@ class WidgetFactory(DjangoModelFactory):
 
 
 class WidgetDictFactory(DictFactory):
-    name = Faker("name")
+    name = factory.LazyFunction(pooled_name)
     partner = SubFactory(PartnerFactory)
     logo = SubFactory(AppImageObjectFactory)
     banners = factory.List([SubFactory(BannerFactory)])
     applications = factory.List([SubFactory(WidgetAppFactory)])
+
+
+def reset_generators():
+    """Restart the link and name counters so values don't depend on earlier tests.
+
+    Call after reseed_random(): the name offset is drawn from factory_boy's seeded random.
+    """
+
+    global link_ids, name_ids
+    link_ids = itertools.count(1)
+    name_ids = itertools.count(factory.random.randgen.randrange(NAMES_POOL_SIZE))
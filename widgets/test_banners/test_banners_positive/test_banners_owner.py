@@ -130,7 +130,7 @@ def test_get_banners_as_partner_owner(owner_api_client, owner, partner):
 
 @Faker.override_default_locale("ru_RU")
 @pytest.mark.django_db
-def test_put_banner_as_partner_owner(owner_api_client, owner, partner):
+def test_put_banner_as_partner_owner(owner_api_client, owner, partner, django_capture_on_commit_callbacks):
     """Test update banner as partner owner."""
 
     # When
@@ -163,7 +163,9 @@ def test_put_banner_as_partner_owner(owner_api_client, owner, partner):
     with patch(
         "apps.devices.tasks.send_fcm_to_devices_by_given_banner.delay", mock_send_fcm_to_devices_by_given_banner
     ):
-        response = owner_api_client.put(endpoint, data=data)
+        # Also run callbacks deferred with transaction.on_commit, which never fire inside the test transaction
+        with django_capture_on_commit_callbacks(execute=True):
+            response = owner_api_client.put(endpoint, data=data)
 
         response_dict = response.json()
 
@@ -184,7 +186,7 @@ def test_put_banner_as_partner_owner(owner_api_client, owner, partner):
 
 @Faker.override_default_locale("ru_RU")
 @pytest.mark.django_db
-def test_patch_banner_as_partner_owner(owner_api_client, owner, partner):
+def test_patch_banner_as_partner_owner(owner_api_client, owner, partner, django_capture_on_commit_callbacks):
     """Test partially update banner as partner owner."""
 
     # When
@@ -217,7 +219,9 @@ def test_patch_banner_as_partner_owner(owner_api_client, owner, partner):
     with patch(
         "apps.devices.tasks.send_fcm_to_devices_by_given_banner.delay", mock_send_fcm_to_devices_by_given_banner
     ):
-        response = owner_api_client.patch(endpoint, data=data)
+        # Also run callbacks deferred with transaction.on_commit, which never fire inside the test transaction
+        with django_capture_on_commit_callbacks(execute=True):
+            response = owner_api_client.patch(endpoint, data=data)
 
         response_dict = response.json()
 
@@ -130,7 +130,7 @@ def test_get_widget_apps_as_partner_owner(owner_api_client, partner, owner):
 
 @Faker.override_default_locale("ru_RU")
 @pytest.mark.django_db
-def test_put_widget_app_as_partner_owner(owner_api_client, partner, owner):
+def test_put_widget_app_as_partner_owner(owner_api_client, partner, owner, django_capture_on_commit_callbacks):
     """Test update widget app as partner owner."""
 
     # When
@@ -164,7 +164,9 @@ def test_put_widget_app_as_partner_owner(owner_api_client, partner, owner):
         "apps.devices.tasks.send_fcm_to_devices_by_given_widget_application.delay",
         mock_send_fcm_to_devices_by_given_widget_application,
     ):
-        response = owner_api_client.put(endpoint, data=data)
+        # Also run callbacks deferred with transaction.on_commit, which never fire inside the test transaction
+        with django_capture_on_commit_callbacks(execute=True):
+            response = owner_api_client.put(endpoint, data=data)
 
         response_dict = response.json()
 
@@ -185,7 +187,7 @@ def test_put_widget_app_as_partner_owner(owner_api_client, partner, owner):
 
 @Faker.override_default_locale("ru_RU")
 @pytest.mark.django_db
-def test_patch_widget_app_as_partner_owner(owner_api_client, partner, owner):
+def test_patch_widget_app_as_partner_owner(owner_api_client, partner, owner, django_capture_on_commit_callbacks):
     """Test partially update widget app as partner owner."""
 
     # When
@@ -219,7 +221,9 @@ def test_patch_widget_app_as_partner_owner(owner_api_client, partner, owner):
         "apps.devices.tasks.send_fcm_to_devices_by_given_widget_application.delay",
         mock_send_fcm_to_devices_by_given_widget_application,
     ):
-        response = owner_api_client.patch(endpoint, data=data)
+        # Also run callbacks deferred with transaction.on_commit, which never fire inside the test transaction
+        with django_capture_on_commit_callbacks(execute=True):
+            response = owner_api_client.patch(endpoint, data=data)
 
         response_dict = response.json()
 
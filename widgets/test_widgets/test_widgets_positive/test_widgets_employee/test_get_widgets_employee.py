@@ -7,12 +7,8 @@ from factory import Faker
 
 from apps.widgets.models import Widget
 from tests.core.factories.images import AppImageObjectFactory, BannerImageObjectFactory
-from tests.utilities.time_converter import FilterByDate
 from tests.widgets.factories.widgets import BannerFactory, WidgetAppFactory, WidgetFactory
 
-# import dates
-dates = FilterByDate()
-
 
 @Faker.override_default_locale("ru_RU")
 @pytest.mark.django_db
@@ -20,14 +16,14 @@ dates = FilterByDate()
     "query_string, expected_value",
     [
         ("?limit=2", 2),
-        (f"?created_at__date__gte={dates.today}", 1),
-        (f"?created_at__date__lte={dates.yesterday}", 2),
-        (f"?created_at__date__gte={dates.month_ago}", 3),
+        ("?created_at__date__gte={dates.today}", 1),
+        ("?created_at__date__lte={dates.yesterday}", 2),
+        ("?created_at__date__gte={dates.month_ago}", 3),
         ("?offset=1", 2),
     ],
 )
 def test_get_widgets_as_partner_employee_filtering_by_date_limit_offset(
-    employee_api_client, partner, query_string, expected_value
+    employee_api_client, partner, query_string, expected_value, dates
 ):
     """
     Test listing widgets as partner employee filtering by limit, date, offset.
@@ -49,7 +45,7 @@ def test_get_widgets_as_partner_employee_filtering_by_date_limit_offset(
     endpoint = reverse("api-root:widgets-list")
 
     # Then
-    response = employee_api_client.get(endpoint + query_string)
+    response = employee_api_client.get(endpoint + query_string.format(dates=dates))
 
     response_dict = response.json()
     widget_objects_count = Widget.objects.count()
@@ -68,11 +64,15 @@ def test_get_widgets_as_partner_employee_filtering_by_date_limit_offset(
     [
         ("?order_by=created_at", ["month ago", "yesterday", "today"]),
         ("?order_by=name", ["month ago", "today", "yesterday"]),
+        ("?ordering=created_at", ["month ago", "yesterday", "today"]),
+        ("?ordering=name", ["month ago", "today", "yesterday"]),
     ],
 )
-def test_get_widgets_as_partner_employee_with_order_by(employee_api_client, partner, query_string, expected_value):
+def test_get_widgets_as_partner_employee_with_order_by(
+    employee_api_client, partner, query_string, expected_value, dates
+):
     """
-    Test listing widgets as partner employee ordering by name, created_at.
+    Test listing widgets as partner employee ordering by name, created_at using order_by & ordering.
     """
     # When
     # Create first widget
@@ -116,7 +116,7 @@ def test_get_widgets_as_partner_employee_with_order_by(employee_api_client, part
     ],
 )
 def test_get_widgets_as_partner_employee_using_name_search_and_search(
-    employee_api_client, employee, partner, query_string, expected_value
+    employee_api_client, employee, partner, query_string, expected_value, dates
 ):
     """
     Test listing widgets using name__search & search filters as a partner employee.
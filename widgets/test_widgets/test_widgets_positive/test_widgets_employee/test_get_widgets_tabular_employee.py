@@ -8,12 +8,8 @@ from factory import Faker
 from apps.widgets.models import Widget
 from tests.core.factories.images import AppImageObjectFactory, BannerImageObjectFactory
 from tests.utilities.read_csv import ReadCSV
-from tests.utilities.time_converter import FilterByDate
 from tests.widgets.factories.widgets import BannerFactory, WidgetAppFactory, WidgetFactory
 
-# import dates
-dates = FilterByDate()
-
 
 @Faker.override_default_locale("ru_RU")
 @pytest.mark.django_db
@@ -78,7 +74,7 @@ def test_get_widgets_in_csv_as_partner_employee_document_structure(employee_api_
     ],
 )
 def test_get_widgets_in_csv_as_partner_employee_with_order_by(
-    employee_api_client, employee, partner, query_string, expected_value
+    employee_api_client, employee, partner, query_string, expected_value, dates
 ):
     """
     Test downloading widgets filtered order_by, order in csv format as a partner employee.
@@ -135,7 +131,7 @@ def test_get_widgets_in_csv_as_partner_employee_with_order_by(
     ],
 )
 def test_get_widgets_in_csv_as_partner_employee_using_name_search_and_search(
-    employee_api_client, employee, partner, query_string, expected_value
+    employee_api_client, employee, partner, query_string, expected_value, dates
 ):
     """
     Test downloading widgets using name__search & search filters in csv format as a partner owner.
@@ -184,13 +180,13 @@ def test_get_widgets_in_csv_as_partner_employee_using_name_search_and_search(
 @pytest.mark.parametrize(
     "query_string, expected_value",
     [
-        (f"?created_at__date__gte={dates.today}", 1),
-        (f"?created_at__date__lte={dates.yesterday}", 2),
-        (f"?created_at__date__gte={dates.month_ago}", 3),
+        ("?created_at__date__gte={dates.today}", 1),
+        ("?created_at__date__lte={dates.yesterday}", 2),
+        ("?created_at__date__gte={dates.month_ago}", 3),
     ],
 )
 def test_get_widgets_in_csv_as_partner_employee_filtering_by_date(
-    employee_api_client, employee, partner, query_string, expected_value
+    employee_api_client, employee, partner, query_string, expected_value, dates
 ):
     """
     Test downloading widgets filtered by date in csv format as a partner employee.
@@ -215,7 +211,7 @@ def test_get_widgets_in_csv_as_partner_employee_filtering_by_date(
     endpoint = reverse("api-root:widgets-export-tabular")
 
     # Then
-    response = employee_api_client.get(endpoint + query_string)
+    response = employee_api_client.get(endpoint + query_string.format(dates=dates))
 
     # Get data from csv
     extracted_data = ReadCSV(response)
@@ -233,14 +229,15 @@ def test_get_widgets_in_csv_as_partner_employee_filtering_by_date(
 @Faker.override_default_locale("ru_RU")
 @pytest.mark.django_db
 @pytest.mark.parametrize(
-    "query_string, expected_value",
+    "query_string, expected_headers",
     [
-        ("?column=created_at&column=partner_id", 2),
-        ("?column=name", 1),
+        ("?column=created_at&column=partner_id", {"время создания", "partner_id"}),
+        ("?column=partner_id&column=created_at", {"время создания", "partner_id"}),
+        ("?column=name", {"название"}),
     ],
 )
 def test_get_widgets_in_csv_as_partner_employee_with_column(
-    employee_api_client, employee, partner, query_string, expected_value
+    employee_api_client, employee, partner, query_string, expected_headers
 ):
     """
     Test downloading widgets filtered by column in csv format as a partner employee.
@@ -268,5 +265,5 @@ def test_get_widgets_in_csv_as_partner_employee_with_column(
     assert response.status_code == status.HTTP_200_OK
     assert widget_objects_count == 1
 
-    assert len(values[0]) == expected_value
-    assert len(headers) == expected_value
+    assert len(values[0]) == len(expected_headers)
+    assert {header.lower() for header in headers} == expected_headers
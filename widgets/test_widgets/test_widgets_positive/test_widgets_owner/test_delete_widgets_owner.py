@@ -37,7 +37,7 @@ Test remove_banners
 
 @Faker.override_default_locale("ru_RU")
 @pytest.mark.django_db
-def test_delete_widget_banner_as_partner_owner(owner_api_client, owner, partner):
+def test_delete_widget_banner_as_partner_owner(owner_api_client, owner, partner, django_capture_on_commit_callbacks):
     """Test deleting banner from a widget object as partner owner."""
 
     # When
@@ -66,7 +66,9 @@ def test_delete_widget_banner_as_partner_owner(owner_api_client, owner, partner)
         "apps.devices.tasks.send_fcm_to_devices_by_given_widget.delay", mock_send_fcm_to_devices_by_given_widget
     ):
 
-        response = owner_api_client.delete(endpoint + f"?ids={banner.id}")
+        # Also run callbacks deferred with transaction.on_commit, which never fire inside the test transaction
+        with django_capture_on_commit_callbacks(execute=True):
+            response = owner_api_client.delete(endpoint + f"?ids={banner.id}")
 
         # Get banners associated with this widget
         updated_widget_with_prefetched_banners = Widget.objects.prefetch_related("banners").get(id=widget.id)
@@ -88,7 +90,9 @@ Test remove_widget_apps
 
 @Faker.override_default_locale("ru_RU")
 @pytest.mark.django_db
-def test_delete_widget_widget_app_as_partner_owner(owner_api_client, owner, partner):
+def test_delete_widget_widget_app_as_partner_owner(
+    owner_api_client, owner, partner, django_capture_on_commit_callbacks
+):
     """Test deleting widget apps from a widget object as partner owner."""
 
     # When
@@ -117,11 +121,13 @@ def test_delete_widget_widget_app_as_partner_owner(owner_api_client, owner, part
         "apps.devices.tasks.send_fcm_to_devices_by_given_widget.delay", mock_send_fcm_to_devices_by_given_widget
     ):
 
-        response = owner_api_client.delete(endpoint + f"?ids={widget_app.id}")
+        # Also run callbacks deferred with transaction.on_commit, which never fire inside the test transaction
+        with django_capture_on_commit_callbacks(execute=True):
+            response = owner_api_client.delete(endpoint + f"?ids={widget_app.id}")
 
         # Get widget apps associated with this widget
         updated_widget_with_prefetched_widget_apps = Widget.objects.prefetch_related("applications").get(id=widget.id)
-        num_of_widget_apps_after = updated_widget_with_prefetched_widget_apps.banners.count()
+        num_of_widget_apps_after = updated_widget_with_prefetched_widget_apps.applications.count()
 
         # should return 200 OK
         assert response.status_code == status.HTTP_204_NO_CONTENT
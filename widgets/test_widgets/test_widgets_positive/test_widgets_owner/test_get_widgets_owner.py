@@ -7,12 +7,8 @@ from factory import Faker
 
 from apps.widgets.models import Widget
 from tests.core.factories.images import AppImageObjectFactory, BannerImageObjectFactory
-from tests.utilities.time_converter import FilterByDate
 from tests.widgets.factories.widgets import BannerFactory, WidgetAppFactory, WidgetFactory
 
-# import dates
-dates = FilterByDate()
-
 
 @Faker.override_default_locale("ru_RU")
 @pytest.mark.django_db
@@ -20,14 +16,14 @@ dates = FilterByDate()
     "query_string, expected_value",
     [
         ("?limit=2", 2),
-        (f"?created_at__date__gte={dates.today}", 1),
-        (f"?created_at__date__lte={dates.yesterday}", 2),
-        (f"?created_at__date__gte={dates.month_ago}", 3),
+        ("?created_at__date__gte={dates.today}", 1),
+        ("?created_at__date__lte={dates.yesterday}", 2),
+        ("?created_at__date__gte={dates.month_ago}", 3),
         ("?offset=1", 2),
     ],
 )
 def test_get_widgets_as_partner_owner_filtering_by_date_limit_offset(
-    owner_api_client, partner, query_string, expected_value
+    owner_api_client, partner, query_string, expected_value, dates
 ):
     """
     Test listing widgets as partner owner filtering by limit, date, offset.
@@ -49,7 +45,7 @@ def test_get_widgets_as_partner_owner_filtering_by_date_limit_offset(
     endpoint = reverse("api-root:widgets-list")
 
     # Then
-    response = owner_api_client.get(endpoint + query_string)
+    response = owner_api_client.get(endpoint + query_string.format(dates=dates))
 
     response_dict = response.json()
     widget_objects_count = Widget.objects.count()
@@ -68,11 +64,13 @@ def test_get_widgets_as_partner_owner_filtering_by_date_limit_offset(
     [
         ("?order_by=created_at", ["month ago", "yesterday", "today"]),
         ("?order_by=name", ["month ago", "today", "yesterday"]),
+        ("?ordering=created_at", ["month ago", "yesterday", "today"]),
+        ("?ordering=name", ["month ago", "today", "yesterday"]),
     ],
 )
-def test_get_widgets_as_partner_owner_with_order_by(owner_api_client, partner, query_string, expected_value):
+def test_get_widgets_as_partner_owner_with_order_by(owner_api_client, partner, query_string, expected_value, dates):
     """
-    Test listing widgets as partner owner ordering by name, created_at.
+    Test listing widgets as partner owner ordering by name, created_at using order_by & ordering.
     """
     # When
     # Create first widget
@@ -116,7 +114,7 @@ def test_get_widgets_as_partner_owner_with_order_by(owner_api_client, partner, q
     ],
 )
 def test_get_widgets_as_partner_owner_using_name_search_and_search(
-    owner_api_client, owner, partner, query_string, expected_value
+    owner_api_client, owner, partner, query_string, expected_value, dates
 ):
     """
     Test listing widgets using name__search & search filters as a partner owner.
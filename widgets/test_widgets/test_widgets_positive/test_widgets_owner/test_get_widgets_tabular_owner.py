@@ -8,12 +8,8 @@ from factory import Faker
 from apps.widgets.models import Widget
 from tests.core.factories.images import AppImageObjectFactory, BannerImageObjectFactory
 from tests.utilities.read_csv import ReadCSV
-from tests.utilities.time_converter import FilterByDate
 from tests.widgets.factories.widgets import BannerFactory, WidgetAppFactory, WidgetFactory
 
-# import dates
-dates = FilterByDate()
-
 
 @Faker.override_default_locale("ru_RU")
 @pytest.mark.django_db
@@ -77,7 +73,7 @@ def test_get_widgets_in_csv_as_partner_owner_document_structure(owner_api_client
     ],
 )
 def test_get_widgets_in_csv_as_partner_owner_with_order_by(
-    owner_api_client, partner, owner, query_string, expected_value
+    owner_api_client, partner, owner, query_string, expected_value, dates
 ):
     """
     Test downloading widgets filtered order_by, order in csv format as a partner owner.
@@ -134,7 +130,7 @@ def test_get_widgets_in_csv_as_partner_owner_with_order_by(
     ],
 )
 def test_get_widgets_in_csv_as_partner_owner_using_name_search_and_search(
-    owner_api_client, owner, partner, query_string, expected_value
+    owner_api_client, owner, partner, query_string, expected_value, dates
 ):
     """
     Test downloading widgets using name__search & search filters in csv format as a partner owner.
@@ -183,13 +179,13 @@ def test_get_widgets_in_csv_as_partner_owner_using_name_search_and_search(
 @pytest.mark.parametrize(
     "query_string, expected_value",
     [
-        (f"?created_at__date__gte={dates.today}", 1),
-        (f"?created_at__date__lte={dates.yesterday}", 2),
-        (f"?created_at__date__gte={dates.month_ago}", 3),
+        ("?created_at__date__gte={dates.today}", 1),
+        ("?created_at__date__lte={dates.yesterday}", 2),
+        ("?created_at__date__gte={dates.month_ago}", 3),
     ],
 )
 def test_get_widgets_in_csv_as_partner_owner_filtering_by_date(
-    owner_api_client, owner, partner, query_string, expected_value
+    owner_api_client, owner, partner, query_string, expected_value, dates
 ):
     """
     Test downloading widgets filtered by date in csv format as a partner owner.
@@ -214,7 +210,7 @@ def test_get_widgets_in_csv_as_partner_owner_filtering_by_date(
     endpoint = reverse("api-root:widgets-export-tabular")
 
     # Then
-    response = owner_api_client.get(endpoint + query_string)
+    response = owner_api_client.get(endpoint + query_string.format(dates=dates))
 
     # Get data from csv
     extracted_data = ReadCSV(response)
@@ -232,14 +228,15 @@ def test_get_widgets_in_csv_as_partner_owner_filtering_by_date(
 @Faker.override_default_locale("ru_RU")
 @pytest.mark.django_db
 @pytest.mark.parametrize(
-    "query_string, expected_value",
+    "query_string, expected_headers",
     [
-        ("?column=created_at&column=partner_id", 2),
-        ("?column=name", 1),
+        ("?column=created_at&column=partner_id", {"время создания", "partner_id"}),
+        ("?column=partner_id&column=created_at", {"время создания", "partner_id"}),
+        ("?column=name", {"название"}),
     ],
 )
 def test_get_widgets_in_csv_as_partner_owner_with_column(
-    owner_api_client, partner, owner, query_string, expected_value
+    owner_api_client, partner, owner, query_string, expected_headers
 ):
     """
     Test downloading widgets filtered by column in csv format as a partner owner.
@@ -267,5 +264,5 @@ def test_get_widgets_in_csv_as_partner_owner_with_column(
     assert response.status_code == status.HTTP_200_OK
     assert widget_objects_count == 1
 
-    assert len(values[0]) == expected_value
-    assert len(headers) == expected_value
+    assert len(values[0]) == len(expected_headers)
+    assert {header.lower() for header in headers} == expected_headers
@@ -16,7 +16,9 @@ from tests.widgets.factories.widgets import BannerFactory, WidgetAppFactory, Wid
 @Faker.override_default_locale("ru_RU")
 @pytest.mark.django_db
 @pytest.mark.parametrize("http_method", ["put", "patch"])
-def test_put_patch_widgets_as_partner_owner(http_method, owner_api_client, owner, partner):
+def test_put_patch_widgets_as_partner_owner(
+    http_method, owner_api_client, owner, partner, django_capture_on_commit_callbacks
+):
     """Test updating and partially updating widgets as partner owner.
 
     According to WidgetUpdateSerializer
@@ -73,7 +75,9 @@ def test_put_patch_widgets_as_partner_owner(http_method, owner_api_client, owner
         "apps.devices.tasks.send_fcm_to_devices_by_given_widget.delay", mock_send_fcm_to_devices_by_given_widget
     ):
 
-        response = http_client_method(endpoint, data=data)
+        # Also run callbacks deferred with transaction.on_commit, which never fire inside the test transaction
+        with django_capture_on_commit_callbacks(execute=True):
+            response = http_client_method(endpoint, data=data)
 
         response_dict = response.json()
 